@@ -1,150 +1,663 @@
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
 from dotenv import load_dotenv, find_dotenv
+from dataclasses import dataclass, field
+import asyncssh
+import asyncio
+from agent_client.device_pool import DevicePool
 import os
+import re
+import atexit
+import hashlib
 import logging
+import threading
+import time
+import uuid
 
 # Load environment variables from .env file
 load_dotenv(find_dotenv(), override=True)
 
 
-# Logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+@dataclass(frozen=True)
+class _Env:
+    api_key: str = None
 
+
+def _load_env():
+    """
+    Read the environment once at import time so clients don't hit os.getenv per instance.
+    """
+    return _Env(api_key=os.getenv("API_KEY"))
+
+
+_ENV = _load_env()
+
+# Exec prompt at the very end of the output, and a "ping <target>" command
+_PROMPT_RE = re.compile(r"#\s*$")
+_PING_CMD_RE = re.compile(r"^ping\s+\S+")
+# IOS prints the ping summary as the last line before the prompt
+_SUCCESS_RE = re.compile(r"Success rate is (\d+) percent")
+_SUCCESS_TAIL = 256
+# End of a ping: either the summary line or the prompt (e.g. after an error message).
+# No capturing groups: Netmiko's read_until_pattern splits on the pattern and would
+# return only the group instead of the whole match
+_PING_DONE_RE = re.compile(r"Success rate is \d+ percent[^\n]*\n|#\s*$")
+# Interactive shell used by the async client: a hostname prompt at the end of the output,
+# alone or after a newline, so a '#' inside an echoed command is not taken for a prompt
+_SHELL_PROMPT_RE = re.compile(r"(?:^|\n)[^\s#>]+[>#]\s*$")
+_ENABLE_PASSWORD_RE = re.compile(r"[Pp]assword:\s*$")
+_ENABLE_REPLY_RE = re.compile(rf"{_SHELL_PROMPT_RE.pattern}|{_ENABLE_PASSWORD_RE.pattern}")
+_ASYNC_CONNECT_TIMEOUT = 10
+_ASYNC_READ_TIMEOUT = 20
+
+
+_LOG = logging.getLogger(__name__)
+
+
+def configure_logging(level=logging.INFO):
+    """
+    Configure the root logger for scripts using this module.
+    Library users are expected to configure logging themselves.
+    :param level: The logging level.
+    """
+    logging.basicConfig(level=level,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+class _SessionCache:
+    """
+    Keep one open Netmiko session per device dictionary (host, credentials and
+    connection settings) and reuse it across calls, so every command does not pay a new
+    TCP + SSH handshake.
+    Sessions idle for longer than idle_timeout are closed by a background reaper, and
+    the least recently used idle sessions are closed once there are more than
+    max_sessions, so the cache doesn't hold device VTY lines indefinitely.
+    """
+    max_sessions = 32
+    idle_timeout = 300.0
+    _sessions = {}
+    _session_locks = {}
+    _lock = threading.Lock()
+    _reaper = None
+
+    @staticmethod
+    def _key(info):
+        # The whole device dict is the key, so a session is never reused for a call with
+        # different credentials or connection settings (e.g. fast_cli); only a digest of
+        # the password is kept
+        settings = {**info, 'password': hashlib.sha256((info['password'] or '').encode()).hexdigest()}
+        return tuple(sorted(settings.items()))
+
+    @classmethod
+    def _acquire(cls, key):
+        """
+        Take the lock of the device, retrying if the reaper dropped that lock meanwhile.
+        """
+        while True:
+            with cls._lock:
+                session_lock = cls._session_locks.setdefault(key, threading.Lock())
+            session_lock.acquire()
+            with cls._lock:
+                if cls._session_locks.get(key) is session_lock:
+                    return session_lock
+            session_lock.release()
+
+    @classmethod
+    def _get(cls, key, info):
+        """
+        Return the cached session for the device, opening a new one on first use or
+        when the cached one is no longer alive. Must be called with the device lock held.
+        :param key: The cache key of the device.
+        :param info: The Netmiko device dictionary.
+        :return: A connected Netmiko session.
+        """
+        with cls._lock:
+            entry = cls._sessions.get(key)
+        if entry is not None and not entry[0].is_alive():
+            cls._drop(key)
+            entry = None
+        if entry is not None:
+            return entry[0]
+        # Connect outside the global lock so one unreachable device doesn't stall the others
+        connection = ConnectHandler(**info)
+        with cls._lock:
+            cls._sessions[key] = [connection, time.monotonic()]
+            if cls._reaper is None:
+                cls._reaper = threading.Thread(target=cls._reap, name="netmiko-session-reaper", daemon=True)
+                cls._reaper.start()
+        cls._prune()
+        return connection
+
+    @classmethod
+    def _drop(cls, key):
+        """
+        Remove the session of the device from the cache and close it.
+        Must be called with the device lock held.
+        """
+        with cls._lock:
+            entry = cls._sessions.pop(key, None)
+        if entry is not None:
+            _disconnect(entry[0])
+
+    @classmethod
+    def _prune(cls, now=None):
+        """
+        Close sessions idle for longer than idle_timeout and the least recently used ones
+        beyond max_sessions. Sessions in use are skipped.
+        :param now: The time.monotonic() value to compare against.
+        """
+        now = time.monotonic() if now is None else now
+        with cls._lock:
+            by_age = sorted(cls._sessions, key=lambda key: cls._sessions[key][1])
+            overflow = set(by_age[:max(len(by_age) - cls.max_sessions, 0)])
+            candidates = [
+                key for key in by_age
+                if key in overflow or now - cls._sessions[key][1] > cls.idle_timeout
+            ]
+            # Locks of devices without a session (e.g. failed connects) are dropped too
+            candidates += [key for key in cls._session_locks if key not in cls._sessions]
+        for key in candidates:
+            with cls._lock:
+                session_lock = cls._session_locks.get(key)
+            if session_lock is not None and not session_lock.acquire(blocking=False):
+                continue
+            try:
+                with cls._lock:
+                    entry = cls._sessions.pop(key, None)
+                    cls._session_locks.pop(key, None)
+            finally:
+                if session_lock is not None:
+                    session_lock.release()
+            if entry is not None:
+                _disconnect(entry[0])
+
+    @classmethod
+    def _reap(cls):
+        while True:
+            time.sleep(cls.idle_timeout / 2)
+            cls._prune()
+
+    @classmethod
+    def run(cls, info, action, reusable=None):
+        """
+        Run action(connection) on the cached session. A dead session is replaced before
+        anything is sent; a session that fails during the action is dropped, since its
+        channel may still hold half-read output, and the error is raised to the caller.
+        :param info: The Netmiko device dictionary.
+        :param action: A callable taking the connection and returning the output.
+        :param reusable: Optional callable taking the connection after the action; the
+            session is dropped when it returns False (e.g. left in config mode).
+        :return: The output of the action.
+        """
+        key = cls._key(info)
+        # A Netmiko channel is not safe for concurrent use, so calls to one device queue up
+        session_lock = cls._acquire(key)
+        try:
+            connection = cls._get(key, info)
+            try:
+                output = action(connection)
+            except Exception:
+                cls._drop(key)
+                raise
+            if reusable is not None and not reusable(connection):
+                cls._drop(key)
+                return output
+            with cls._lock:
+                if key in cls._sessions:
+                    cls._sessions[key][1] = time.monotonic()
+            return output
+        finally:
+            session_lock.release()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Disconnect every cached session.
+        """
+        with cls._lock:
+            sessions = [entry[0] for entry in cls._sessions.values()]
+            cls._sessions.clear()
+        for connection in sessions:
+            _disconnect(connection)
+
+
+def _disconnect(connection):
+    try:
+        connection.disconnect()
+    except Exception:
+        pass
+
+
+atexit.register(_SessionCache.close_all)
+
+
+async def _read_until(process, pattern, timeout=None):
+    """
+    Read an asyncssh shell until the accumulated output matches pattern.
+    :param process: The asyncssh shell process.
+    :param pattern: A compiled regex, usually anchored at the end of the output.
+    :param timeout: Seconds to wait before raising TimeoutError.
+    :return: The output read.
+    """
+    output = ""
+    async with asyncio.timeout(timeout or _ASYNC_READ_TIMEOUT):
+        while not pattern.search(output):
+            chunk = await process.stdout.read(4096)
+            if not chunk:
+                raise ConnectionResetError("Session closed before the prompt was received")
+            output += chunk
+    return output
+
+
+def _clean_commands(commands):
+    """
+    Normalize commands into a list of stripped, non-empty lines in a single pass.
+    :param commands: A newline separated string or a list of commands.
+    :return: The list of commands to send.
+    """
+    lines = commands.splitlines() if isinstance(commands, str) else commands
+    return [line for line in (_strip_command(line) for line in lines) if line]
+
+
+def _strip_command(line):
+    if not isinstance(line, str):
+        raise ValueError(f"Invalid command {line!r}: expected a string")
+    return line.strip()
+
+
+def _to_pairs(items, allow_tuples=True):
+    """
+    Normalize a command sequence into (command, expect_pattern) tuples. Items may be
+    {"command": ..., "expect": ...} dicts, (command, expect_pattern) tuples or 2-item
+    lists when allow_tuples is set, or plain commands, which wait for the prompt.
+    Empty plain commands are dropped.
+    :param items: A list of pairs and plain commands.
+    :param allow_tuples: Accept tuples and lists as pairs. config_command turns this off,
+        since a nested list there is more likely a list of commands than a pair.
+    :return: The list of pairs to send.
+    """
+    if isinstance(items, str):
+        raise ValueError("Invalid command sequence: expected a list, not a string")
+    pairs = []
+    for item in items:
+        if isinstance(item, dict) and isinstance(item.get("command"), str):
+            pairs.append((item["command"], item.get("expect") or _PROMPT_RE.pattern))
+        elif (allow_tuples and isinstance(item, (list, tuple)) and len(item) == 2
+                and all(isinstance(part, str) for part in item)):
+            pairs.append(tuple(item))
+        elif isinstance(item, str):
+            if item.strip():
+                pairs.append((item.strip(), _PROMPT_RE.pattern))
+        else:
+            raise ValueError(f"Invalid command {item!r}: expected a string or a command/expect pair")
+    return pairs
+
+
+def _at_base_prompt(connection):
+    """
+    Tell whether the session is back at the privileged exec prompt, so it can be reused
+    by the next call.
+    """
+    try:
+        return connection.find_prompt() == f"{connection.base_prompt}#"
+    except Exception:
+        return False
+
+
+@dataclass(slots=True, frozen=True)
 class AgentCiscoClient:
+    """
+    Client for Cisco devices with optional default credentials.
+    :param HOST: The host of the Cisco device.
+    :param USERNAME: The username for the Cisco device.
+    :param PASSWORD: The password for the Cisco device.
+    :param fast_cli: Use Netmiko's short delays and pattern-based prompt detection.
+        Set it to False for legacy devices with slow banners or prompts.
+    """
+    HOST: str = None
+    USERNAME: str = None
+    PASSWORD: str = field(default=None, repr=False)
+    fast_cli: bool = True
 
-    def __init__(self, HOST=None, USERNAME=None, PASSWORD=None):
+    @property
+    def device_info_cisco(self):
         """
-    
-        Initialize the AgentClient with device credentials.
-        :param HOST: The host of the Cisco device.
-        :param USERNAME: The username for the Cisco device.
-        :param PASSWORD: The password for the Cisco device.
+        Netmiko device dictionary for the Cisco device, built on demand.
         """
-        self.device_info_cisco = {
+        return {
             'device_type': 'cisco_ios',
-            'host': HOST,
-            'username': USERNAME,
-            'password': PASSWORD,
+            'host': self.HOST,
+            'username': self.USERNAME,
+            'password': self.PASSWORD,
+            'fast_cli': self.fast_cli,
+            'global_delay_factor': 0.1 if self.fast_cli else 1,
+            'session_log': None,
+            # Fail fast on dead devices instead of waiting out the default timeouts
+            'conn_timeout': 10,
+            'auth_timeout': 15,
+            'banner_timeout': 15,
         }
 
-        self.device_info_linux = {
+    @property
+    def device_info_linux(self):
+        """
+        Netmiko device dictionary for a Linux host, built on demand.
+        """
+        return {
             'device_type': 'linux',
-            'host': HOST,
-            'username': USERNAME,
-            'password': PASSWORD,
+            'host': self.HOST,
+            'username': self.USERNAME,
+            'password': self.PASSWORD,
         }
 
+    @property
+    def api_key(self):
+        return _ENV.api_key
 
-        self.api_key = os.getenv("API_KEY")
-        self.logger = logging.getLogger(__name__)
+    def _cisco_info(self, HOST, USERNAME, PASSWORD):
+        """
+        Build the Netmiko device dictionary for a single call.
+        A fresh dict per call keeps concurrent calls on one client from connecting to
+        each other's hosts.
+        """
+        return {**self.device_info_cisco, 'host': HOST, 'username': USERNAME, 'password': PASSWORD}
 
-    def show_command(self, command, HOST, USERNAME, PASSWORD):
+    def show_command(self, command, HOST, USERNAME, PASSWORD, structured=False):
         """
         Send a show command to the Cisco device and return the output.
         :param command: The command to be executed on the device.
+        :param structured: Parse the output with TextFSM (ntc-templates) into a list of
+            dictionaries. Falls back to the raw text when no template matches the command.
         :return: The output of the command.
         """
         try:
-            self.device_info_cisco['host'] = HOST
-            self.device_info_cisco['username'] = USERNAME
-            self.device_info_cisco['password'] = PASSWORD
-            
-            self.logger.info(f"Connecting to {self.device_info_cisco['host']} with provided credentials.")
-            with ConnectHandler(**self.device_info_cisco) as connection:
-                self.logger.info(f"Connected to {self.device_info_cisco['host']}")
-                self.logger.info(f"Sending command: {command}")
-
-                output = connection.send_command(command, read_timeout=20)
-                self.logger.debug("Command output:")
-                for line in output.splitlines():
-                    self.logger.debug(line)
-
-                connection.disconnect()
-                self.logger.info(f"Disconnected from {self.device_info_linux['host']}")
+            info = self._cisco_info(HOST, USERNAME, PASSWORD)
 
-                return output
+            _LOG.info("Connecting to %s with provided credentials.", HOST)
+
+            def _send(connection):
+                _LOG.info("Connected to %s", HOST)
+                _LOG.info("Sending command: %s", command)
+                return connection.send_command(command, read_timeout=20, use_textfsm=structured)
+
+            output = _SessionCache.run(info, _send)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("Command output:\n%s", output)
+
+            return output
 
         except NetmikoTimeoutException as e:
-            self.logger.error(f"Timeout error while executing command '{command}' on {self.device_info_cisco['host']}: {e}")
+            _LOG.error("Timeout error while executing command '%s' on %s: %s", command, HOST, e)
             return "Timeout error"
         except NetmikoAuthenticationException as e:
-            self.logger.error(f"Authentication error while executing command '{command}' on {self.device_info_cisco['host']}: {e}")
+            _LOG.error("Authentication error while executing command '%s' on %s: %s", command, HOST, e)
             return "Authentication error"
 
-    def config_command(self, commands, HOST, USERNAME, PASSWORD):
+    def config_command(self, commands, HOST, USERNAME, PASSWORD, fast_config=False):
         """
         Send configuration commands to the Cisco device and return the output.
-        :param commands: A list of configuration commands to be executed.
+        :param commands: A list of configuration commands to be executed. Items may also be
+            {"command": ..., "expect": ...} dicts for commands that answer with their own
+            prompt (e.g. a confirmation); the list is then sent with send_command_sequence
+            semantics.
+        :param fast_config: Push all commands in a single write and read the output once,
+            instead of waiting for the prompt after every line. Leave it off for devices
+            that authorize each command individually (e.g. TACACS command authorization).
         :return: The output of the commands.
         """
         try:
-            self.device_info_cisco['host'] = HOST
-            self.device_info_cisco['username'] = USERNAME
-            self.device_info_cisco['password'] = PASSWORD
-            with ConnectHandler(**self.device_info_cisco) as connection:
-                self.logger.info(f"Connected to {self.device_info_cisco['host']}")
-                self.logger.info(f"Applying configuration commands: {commands}")
+            info = self._cisco_info(HOST, USERNAME, PASSWORD)
+
+            sequence = not isinstance(commands, str) and any(isinstance(command, dict) for command in commands)
+            commands = _to_pairs(commands, allow_tuples=False) if sequence else _clean_commands(commands)
+            if not commands:
+                _LOG.warning("No valid commands provided.")
+                return None
 
+            def _send(connection):
+                _LOG.info("Connected to %s", HOST)
+                _LOG.info("Applying configuration commands: %s", commands)
                 # Enter enable mode
                 connection.enable()
-                            # Process commands properly based on type
-                if isinstance(commands, str):
-                    # Split string commands by newline
-                    commands = [command.strip() for command in commands.split("\n") if command.strip()]
-
-                commands = [command.strip() for command in commands if command.strip()]
-                if not commands:
-                    self.logger.warning("No valid commands provided.")
-                    return None
-
+                if sequence:
+                    output = connection.config_mode()
+                    output += self._send_sequence(connection, commands)
+                    return output + connection.exit_config_mode()
+                if fast_config:
+                    return self._send_config_batch(connection, commands)
                 # Send configuration commands
-                output = connection.send_config_set(commands)
-                self.logger.info("Configuration applied successfully.")
-                self.logger.debug(f"Configuration output: {output}")
+                return connection.send_config_set(commands)
 
-                connection.disconnect()
-                self.logger.info(f"Disconnected from {self.device_info_linux['host']}")
+            output = _SessionCache.run(info, _send, reusable=_at_base_prompt if sequence else None)
+            _LOG.info("Configuration applied successfully.")
+            _LOG.debug("Configuration output: %s", output)
 
-                return output
+            return output
 
         except NetmikoTimeoutException as e:
-            self.logger.error(f"Timeout error while executing command '{commands}' on {self.device_info_cisco['host']}: {e}")
+            _LOG.error("Timeout error while executing command '%s' on %s: %s", commands, HOST, e)
             return "Timeout error"
         except NetmikoAuthenticationException as e:
-            self.logger.error(f"Authentication error while executing command '{commands}' on {self.device_info_cisco['host']}: {e}")
+            _LOG.error("Authentication error while executing command '%s' on %s: %s", commands, HOST, e)
             return "Authentication error"
         
+    def _send_config_batch(self, connection, commands):
+        """
+        Write the whole configuration block to the channel at once and drain the output
+        with a single read, so N commands cost one round-trip instead of N.
+        :param connection: The connected Netmiko session.
+        :param commands: A list of configuration commands to be executed.
+        :return: The output of the commands.
+        """
+        output = connection.config_mode()
+        # Close the block with a comment line nobody else sends, so the read can't stop
+        # at an earlier prompt when the block repeats a line such as "no shutdown"
+        marker = f"! end of batch {uuid.uuid4().hex}"
+        connection.write_channel("\n".join([*commands, marker]) + "\n")
+        output += connection.read_until_pattern(
+            rf"{re.escape(marker)}.*#\s*$",
+            re_flags=re.DOTALL,
+            read_timeout=len(commands) * 0.5 + 5,
+        )
+        output += connection.exit_config_mode()
+        return output
+
+    def _send_sequence(self, connection, pairs):
+        """
+        Send each command and read exactly up to its expected pattern, without the
+        per-command delays of send_command.
+        :param connection: The connected Netmiko session.
+        :param pairs: A list of (command, expect_pattern) tuples, as built by _to_pairs.
+        :return: The output of the commands.
+        """
+        return connection.send_multiline(pairs, read_timeout=10)
+
+    def send_command_sequence(self, pairs, HOST, USERNAME, PASSWORD):
+        """
+        Send a sequence of exec commands whose prompts are known in advance, e.g.
+        [("copy running-config startup-config", r"Destination filename"), ("", r"#")].
+        The session is not reused afterwards unless it is back at the privileged exec prompt.
+        :param pairs: A list of (command, expect_pattern) pairs, {"command", "expect"}
+            dicts or plain commands.
+        :return: The output of the commands.
+        """
+        try:
+            info = self._cisco_info(HOST, USERNAME, PASSWORD)
+            pairs = _to_pairs(pairs)
+
+            def _send(connection):
+                _LOG.info("Connected to %s", HOST)
+                _LOG.info("Sending command sequence: %s", pairs)
+                return self._send_sequence(connection, pairs)
+
+            return _SessionCache.run(info, _send, reusable=_at_base_prompt)
+
+        except NetmikoTimeoutException as e:
+            _LOG.error("Timeout error while executing command '%s' on %s: %s", pairs, HOST, e)
+            return "Timeout error"
+        except NetmikoAuthenticationException as e:
+            _LOG.error("Authentication error while executing command '%s' on %s: %s", pairs, HOST, e)
+            return "Authentication error"
+
     def ping_cisco_command(self, command, HOST, USERNAME, PASSWORD):
         """
         Send ping commands to Cisco device and return the output with wait time.
         The input should start with "ping" and be followed by the IP address.
         :param command: The ping command to be executed on the device.
+        :return: A dictionary with the success percentage ("success_pct") and the raw
+            output ("raw"), or an error message.
         """
         try:
-            if not command.startswith("ping"):
+            if not _PING_CMD_RE.match(command):
                 return "Invalid command. Please use 'ping' command."
-            self.device_info_cisco['host'] = HOST
-            self.device_info_cisco['username'] = USERNAME
-            self.device_info_cisco['password'] = PASSWORD
-            with ConnectHandler(**self.device_info_cisco) as connection:
-                self.logger.info(f"Connected to {self.device_info_cisco['host']}")
-                self.logger.info(f"Sending ping command: {command}")
+            info = self._cisco_info(HOST, USERNAME, PASSWORD)
 
+            def _send(connection):
+                _LOG.info("Connected to %s", HOST)
+                _LOG.info("Sending ping command: %s", command)
                 # Send ping command
-                output = connection.send_command(command, read_timeout=30, expect_string=r"#", strip_prompt=False, strip_command=False)
-                if "!" in output:
-                    return output
-                else:
-                    return "Ping failed. No response received."
+                connection.write_channel(command + connection.RETURN)
+                # IOS prints the summary before the prompt, so stop there and only drain the
+                # prompt afterwards instead of waiting on a single long read
+                output = connection.read_until_pattern(_PING_DONE_RE.pattern, read_timeout=30)
+                if _SUCCESS_RE.search(output[-_SUCCESS_TAIL:]):
+                    output += connection.read_until_pattern(_PROMPT_RE.pattern, read_timeout=5)
+                return output
+
+            output = _SessionCache.run(info, _send)
+            # Only the trailing summary matters, so don't scan the echoed header and reply lines
+            match = _SUCCESS_RE.search(output[-_SUCCESS_TAIL:])
+            if match is None:
+                return "Ping failed. No response received."
+            return {"success_pct": int(match.group(1)), "raw": output}
         except NetmikoTimeoutException as e:
-            self.logger.error(f"Timeout error while executing command '{command}' on {self.device_info_cisco['host']}: {e}")
+            _LOG.error("Timeout error while executing command '%s' on %s: %s", command, HOST, e)
             return "Timeout error"
         except NetmikoAuthenticationException as e:
-            self.logger.error(f"Authentication error while executing command '{command}' on {self.device_info_cisco['host']}: {e}")
+            _LOG.error("Authentication error while executing command '%s' on %s: %s", command, HOST, e)
+            return "Authentication error"
+
+    async def _arun(self, HOST, USERNAME, PASSWORD, pool, action):
+        """
+        Run action(conn) on an asyncssh connection, borrowed from the pool when one is
+        given and opened for this call otherwise.
+        """
+        if pool is not None:
+            return await pool.run(HOST, USERNAME, PASSWORD, action)
+        async with asyncssh.connect(HOST, username=USERNAME, password=PASSWORD, known_hosts=None,
+                                    connect_timeout=_ASYNC_CONNECT_TIMEOUT) as conn:
+            return await action(conn)
+
+    async def ashow_command(self, command, HOST, USERNAME, PASSWORD, pool=None):
+        """
+        Async version of show_command built on asyncssh, so many devices can be queried
+        concurrently with asyncio.gather.
+        :param command: The command to be executed on the device.
+        :param pool: Optional DevicePool bounding concurrency and reusing sessions.
+        :return: The output of the command.
+        """
+        async def _send(conn):
+            _LOG.info("Sending command: %s", command)
+            result = await conn.run(command, timeout=_ASYNC_READ_TIMEOUT)
+            return result.stdout
+
+        try:
+            _LOG.info("Connecting to %s with provided credentials.", HOST)
+            return await self._arun(HOST, USERNAME, PASSWORD, pool, _send)
+        except asyncssh.PermissionDenied as e:
+            _LOG.error("Authentication error while executing command '%s' on %s: %s", command, HOST, e)
             return "Authentication error"
+        except TimeoutError as e:
+            _LOG.error("Timeout error while executing command '%s' on %s: %s", command, HOST, e)
+            return "Timeout error"
+        except (OSError, asyncssh.Error) as e:
+            _LOG.error("Connection error while executing command '%s' on %s: %s", command, HOST, e)
+            return "Connection error"
+
+    async def aconfig_command(self, commands, HOST, USERNAME, PASSWORD, pool=None):
+        """
+        Async version of config_command built on asyncssh.
+        Some IOS releases close the session after the first exec request, so the commands
+        are written to a single interactive shell instead of one exec per command.
+        :param commands: A list of configuration commands to be executed.
+        :param pool: Optional DevicePool bounding concurrency and reusing sessions.
+        :return: The output of the commands.
+        """
+        commands = _clean_commands(commands)
+        if not commands:
+            _LOG.warning("No valid commands provided.")
+            return None
+
+        async def _send(conn):
+            _LOG.info("Applying configuration commands: %s", commands)
+            process = await conn.create_process(term_type="vt100")
+            try:
+                # Wait for the initial exec prompt
+                output = await _read_until(process, _SHELL_PROMPT_RE)
+                if output.rstrip().endswith(">"):
+                    output += await self._aenable(process, PASSWORD)
+                for line in ["terminal length 0", "configure terminal", *commands, "end"]:
+                    # One line at a time, so a '#' inside a command can't be taken for a prompt
+                    process.stdin.write(line + "\n")
+                    output += await _read_until(process, _SHELL_PROMPT_RE)
+                return output
+            finally:
+                process.close()
+                await process.wait_closed()
+
+        try:
+            return await self._arun(HOST, USERNAME, PASSWORD, pool, _send)
+        except asyncssh.PermissionDenied as e:
+            _LOG.error("Authentication error while executing command '%s' on %s: %s", commands, HOST, e)
+            return "Authentication error"
+        except TimeoutError as e:
+            _LOG.error("Timeout error while executing command '%s' on %s: %s", commands, HOST, e)
+            return "Timeout error"
+        except (OSError, asyncssh.Error) as e:
+            _LOG.error("Connection error while executing command '%s' on %s: %s", commands, HOST, e)
+            return "Connection error"
+
+    async def _aenable(self, process, PASSWORD):
+        """
+        Move an interactive shell from user exec ('>') to privileged exec ('#').
+        The login password is used if the device asks for an enable password.
+        :param process: The asyncssh shell process.
+        :return: The output of the exchange.
+        """
+        process.stdin.write("enable\n")
+        output = await _read_until(process, _ENABLE_REPLY_RE)
+        if _ENABLE_PASSWORD_RE.search(output):
+            process.stdin.write(PASSWORD + "\n")
+            output += await _read_until(process, _SHELL_PROMPT_RE)
+        if not output.rstrip().endswith("#"):
+            raise asyncssh.PermissionDenied("Could not enter enable mode")
+        return output
+
+    async def ashow_command_many(self, command, HOSTS, USERNAME, PASSWORD, max_connections=50):
+        """
+        Run the same show command on several devices concurrently.
+        :param command: The command to be executed on every device.
+        :param HOSTS: The hosts of the Cisco devices.
+        :param max_connections: Maximum number of SSH sessions open at the same time.
+        :return: A dictionary mapping each host to its output.
+        """
+        async with DevicePool(max_connections=max_connections) as pool:
+            outputs = await asyncio.gather(
+                *(self.ashow_command(command, host, USERNAME, PASSWORD, pool=pool) for host in HOSTS)
+            )
+        return dict(zip(HOSTS, outputs))
+
+    def show_command_many(self, command, HOSTS, USERNAME, PASSWORD, max_connections=50):
+        """
+        Blocking wrapper around ashow_command_many for synchronous callers.
+        :param command: The command to be executed on every device.
+        :param HOSTS: The hosts of the Cisco devices.
+        :param max_connections: Maximum number of SSH sessions open at the same time.
+        :return: A dictionary mapping each host to its output.
+        """
+        return asyncio.run(self.ashow_command_many(command, HOSTS, USERNAME, PASSWORD, max_connections))
 
 if __name__ == "__main__":
+    configure_logging()
     agent_client = AgentCiscoClient()
     connection = agent_client.ssh_to_linux_device_and_send_command(commands=["ls \nls"], HOST="172.168.1.11", USERNAME="root", PASSWORD="root")
\ No newline at end of file
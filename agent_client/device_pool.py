@@ -0,0 +1,175 @@
+from collections import defaultdict
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import logging
+import time
+
+import asyncssh
+
+_LOG = logging.getLogger(__name__)
+
+
+def _key(HOST, USERNAME, PASSWORD):
+    # Idle connections are only handed to calls with the same credentials; only a digest
+    # of the password is kept
+    return (HOST, USERNAME, hashlib.sha256((PASSWORD or '').encode()).hexdigest())
+
+
+class DevicePool:
+
+    def __init__(self, max_connections=50, max_idle_per_host=2, max_idle=10, idle_timeout=60.0,
+                 connect_timeout=10):
+        """
+        Bounded pool of asyncssh connections for fleet-wide scans.
+        At most max_connections sessions are checked out at the same time, and finished
+        sessions are kept per host for reuse instead of doing a new SSH handshake.
+        Idle sessions are capped per host and in total, so at most
+        max_connections + max_idle connections are ever open.
+        Use the pool with "async with": entering it starts the reaper task that closes
+        idle sessions, and leaving it stops the reaper and closes what is left.
+        :param max_connections: Maximum number of sessions in use at the same time.
+        :param max_idle_per_host: Maximum number of idle sessions kept for each host.
+        :param max_idle: Maximum number of idle sessions kept across all hosts.
+        :param idle_timeout: Seconds after which an idle session is closed by the reaper.
+        :param connect_timeout: Seconds to wait for a new SSH connection.
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self._sem = asyncio.Semaphore(max_connections)
+        self._idle = defaultdict(list)
+        self._idle_count = 0
+        self._reaper = None
+
+    @asynccontextmanager
+    async def checkout(self, HOST, USERNAME, PASSWORD):
+        """
+        Borrow a connection to the device and give it back to the pool on exit.
+        A connection that raised inside the block is closed instead of returned.
+        Prefer run() when the work can be retried, since it replaces a stale idle
+        connection transparently.
+        :param HOST: The host of the device.
+        :param USERNAME: The username for the device.
+        :param PASSWORD: The password for the device.
+        :return: An asyncssh client connection.
+        """
+        key = _key(HOST, USERNAME, PASSWORD)
+        async with self._sem:
+            conn, _ = await self._acquire(HOST, USERNAME, PASSWORD)
+            try:
+                yield conn
+            except BaseException:
+                conn.close()
+                raise
+            self._checkin(key, conn)
+
+    async def run(self, HOST, USERNAME, PASSWORD, action):
+        """
+        Run action(conn) on a pooled connection to the device.
+        If a reused idle connection can no longer open a channel, it is replaced by a
+        fresh connection and the action is retried once; nothing reached the device.
+        :param HOST: The host of the device.
+        :param USERNAME: The username for the device.
+        :param PASSWORD: The password for the device.
+        :param action: An async callable taking the connection.
+        :return: The result of the action.
+        """
+        key = _key(HOST, USERNAME, PASSWORD)
+        async with self._sem:
+            conn, reused = await self._acquire(HOST, USERNAME, PASSWORD)
+            try:
+                result = await action(conn)
+            except asyncssh.ChannelOpenError:
+                conn.close()
+                if not reused:
+                    raise
+                _LOG.info("Pooled connection to %s went stale, reconnecting", HOST)
+                conn = await self._connect(HOST, USERNAME, PASSWORD)
+                try:
+                    result = await action(conn)
+                except BaseException:
+                    conn.close()
+                    raise
+            except BaseException:
+                conn.close()
+                raise
+            self._checkin(key, conn)
+            return result
+
+    async def _acquire(self, HOST, USERNAME, PASSWORD):
+        conn = self._pop_idle(_key(HOST, USERNAME, PASSWORD))
+        if conn is not None:
+            return conn, True
+        return await self._connect(HOST, USERNAME, PASSWORD), False
+
+    async def _connect(self, HOST, USERNAME, PASSWORD):
+        _LOG.info("Opening new pooled connection to %s", HOST)
+        return await asyncssh.connect(HOST, username=USERNAME, password=PASSWORD, known_hosts=None,
+                                      connect_timeout=self.connect_timeout)
+
+    def _pop_idle(self, key):
+        idle = self._idle[key]
+        while idle:
+            conn, _ = idle.pop()
+            self._idle_count -= 1
+            if not conn.is_closed():
+                return conn
+        return None
+
+    def _checkin(self, key, conn):
+        idle = self._idle[key]
+        if conn.is_closed():
+            return
+        if len(idle) >= self.max_idle_per_host or self._idle_count >= self.max_idle:
+            conn.close()
+            return
+        idle.append((conn, time.monotonic()))
+        self._idle_count += 1
+
+    async def _reap(self):
+        """
+        Periodically close sessions that stayed idle longer than idle_timeout.
+        """
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            deadline = time.monotonic() - self.idle_timeout
+            for key, idle in list(self._idle.items()):
+                keep = []
+                for conn, last_used in idle:
+                    if last_used < deadline:
+                        conn.close()
+                    else:
+                        keep.append((conn, last_used))
+                self._idle_count -= len(idle) - len(keep)
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+
+    async def close(self):
+        """
+        Stop the reaper and close every idle session.
+        """
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+        idle, self._idle = self._idle, defaultdict(list)
+        self._idle_count = 0
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+                await conn.wait_closed()
+
+    async def __aenter__(self):
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
+
+from netmiko.utilities import get_structured_data
+
+from agent_client.cisco_agent import AgentCiscoClient
+
+
+async def _gather_shard(command, HOSTS, USERNAME, PASSWORD, max_connections):
+    agent_client = AgentCiscoClient()
+    return await agent_client.ashow_command_many(command, HOSTS, USERNAME, PASSWORD, max_connections)
+
+
+def _run_shard(command, HOSTS, USERNAME, PASSWORD, max_connections, structured):
+    """
+    Worker entry point: run one shard of hosts on its own event loop, then parse the
+    outputs in this process so TextFSM work is spread across CPUs.
+    """
+    outputs = asyncio.run(_gather_shard(command, HOSTS, USERNAME, PASSWORD, max_connections))
+    if structured:
+        outputs = {
+            host: get_structured_data(output, platform="cisco_ios", command=command)
+            for host, output in outputs.items()
+        }
+    return outputs
+
+
+def run_fleet(command, HOSTS, USERNAME, PASSWORD, workers=None, max_connections=50, structured=False):
+    """
+    Run a show command across many Cisco devices, splitting the hosts over worker
+    processes that each fan out with asyncio.
+    A single event loop becomes CPU bound on output parsing for large fleets, so each
+    process gets its own loop and parses its own shard.
+    :param command: The command to be executed on every device.
+    :param HOSTS: The hosts of the Cisco devices.
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+    :param max_connections: Maximum number of SSH sessions open at the same time per worker.
+    :param structured: Parse every output with TextFSM (ntc-templates) in the workers.
+    :return: A dictionary mapping each host to its output.
+    """
+    HOSTS = list(HOSTS)
+    if not HOSTS:
+        return {}
+    workers = min(workers or os.cpu_count() or 1, len(HOSTS))
+    shards = [HOSTS[i::workers] for i in range(workers)]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_shard, command, shard, USERNAME, PASSWORD, max_connections, structured)
+            for shard in shards
+        ]
+        for future in futures:
+            results.update(future.result())
+    return {host: results[host] for host in HOSTS}
@@ -1,13 +1,11 @@
 from langgraph.prebuilt import create_react_agent
 from langchain_mistralai import ChatMistralAI
-from agent_client.cisco_agent import AgentCiscoClient
+from agent_client.cisco_agent import AgentCiscoClient, configure_logging
 from langchain.tools import tool
 from langchain.prompts import PromptTemplate
 
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Initialize the agent client and model
@@ -38,7 +36,7 @@ def show_command(command: str) -> str:
     :param command: The command to be executed on the device.
     :return: The output of the command.
     """
-    logger.info(f"Sending command: {command}")
+    logger.info("Sending command: %s", command)
     output = cisco_agent.show_command(command)
     print(output)
     return output if output else "Failed to execute command."
@@ -51,7 +49,7 @@ def config_command(command: list) -> str:
     :param config command: seperated by new line
     :return: The output of the command. 
     """
-    logger.info(f"Sending command: {command}")
+    logger.info("Sending command: %s", command)
     output = cisco_agent.config_command(command)
     logger.info(output)
     return output if output else "Failed to execute command."
@@ -64,6 +62,7 @@ agent = create_react_agent(
 
 # Run the agent with a sample command
 if __name__ == "__main__":
+    configure_logging()
 
     while True:
         user_input = input("Please input your question you want to ask the agent: ")
@@ -1,6 +1,6 @@
 import asyncio
 from mcp.server.fastmcp import FastMCP
-from agent_client.cisco_agent import AgentCiscoClient
+from agent_client.cisco_agent import AgentCiscoClient, configure_logging
 
 # Create MCP server
 mcp = FastMCP(name="Cisco-IOS-config", instructions="""
@@ -34,7 +34,7 @@ async def config_cisco_command(command, HOST, USERNAME, PASSWORD) -> str:
         return f"Error: {e}"
 
 @mcp.tool()
-async def show_cisco_command(command, HOST, USERNAME, PASSWORD) -> str:
+async def show_cisco_command(command, HOST, USERNAME, PASSWORD, structured: bool = False) -> str | list:
     """
     Send a 'show' command to the Cisco device and return the output.
     Args:
@@ -42,13 +42,14 @@ async def show_cisco_command(command, HOST, USERNAME, PASSWORD) -> str:
         host: IP/DNS of the Cisco device.
         username: Username for authentication.
         password: Password for authentication.
+        structured: Parse the output into a list of records with TextFSM when a template exists.
     
     Returns:
-        str: Output of the command execution.
+        str | list: Output of the command execution.
     """
     try:
         output = await asyncio.wait_for(
-            asyncio.to_thread(cisco_agent.show_command, command, HOST, USERNAME, PASSWORD),
+            asyncio.to_thread(cisco_agent.show_command, command, HOST, USERNAME, PASSWORD, structured),
             timeout=30.0
         )
         return output
@@ -58,10 +59,11 @@ async def show_cisco_command(command, HOST, USERNAME, PASSWORD) -> str:
         return f"Error: {e}"
 
 @mcp.tool()
-async def ping_cisco_device(command, HOST, USERNAME, PASSWORD) -> str:
+async def ping_cisco_device(command, HOST, USERNAME, PASSWORD) -> dict | str:
     """
     Send a ping command to the Cisco device and return the output.
     The input should valid ios ping cisco command with the "ping" keyword.
+    Returns the success percentage ("success_pct") and the raw output ("raw").
     """
     try:
         output = await asyncio.wait_for(
@@ -75,4 +77,5 @@ async def ping_cisco_device(command, HOST, USERNAME, PASSWORD) -> str:
         return f"Error: {e}"
 
 if __name__ == "__main__":
+    configure_logging()
     mcp.run(transport="stdio")
@@ -0,0 +1,231 @@
+import asyncio
+
+import pytest
+
+from netmiko.base_connection import BaseConnection
+
+from agent_client import cisco_agent
+from agent_client.cisco_agent import AgentCiscoClient
+
+
+class FakeConnection:
+    """
+    Minimal stand-in for a Netmiko session. Whatever is written is answered by
+    responder(text), and the answer is handed back in small chunks to exercise reads
+    that end in the middle of a line. Reads use Netmiko's real read_until_pattern.
+    """
+    RETURN = "\n"
+    read_timeout_override = None
+    read_until_pattern = BaseConnection.read_until_pattern
+
+    def __init__(self, responder, chunk_size=7):
+        self.responder = responder
+        self.chunk_size = chunk_size
+        self.pending = ""
+        self.written = ""
+        self._read_buffer = ""
+
+    def write_channel(self, text):
+        self.written += text
+        self.pending += self.responder(text)
+
+    def read_channel(self):
+        output, self._read_buffer = self._read_buffer, ""
+        output += self.pending[:self.chunk_size]
+        self.pending = self.pending[self.chunk_size:]
+        return output
+
+    def config_mode(self):
+        return "configure terminal\r\nR1(config)#"
+
+    def exit_config_mode(self):
+        return "end\r\nR1#"
+
+    def is_alive(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+
+PING_OK = (
+    "ping 10.0.0.2\r\n"
+    "Type escape sequence to abort.\r\n"
+    "Sending 5, 100-byte ICMP Echos to 10.0.0.2, timeout is 2 seconds:\r\n"
+    "!!!!!\r\n"
+    "Success rate is 100 percent (5/5), round-trip min/avg/max = 1/1/2 ms\r\n"
+    "R1#"
+)
+
+PING_BAD_HOST = (
+    "ping nowhere\r\n"
+    "Translating \"nowhere\"\r\n"
+    "% Unrecognized host or address, or protocol not running.\r\n"
+    "\r\n"
+    "R1#"
+)
+
+
+def ping_with_transcript(monkeypatch, transcript):
+    connection = FakeConnection(lambda text: transcript)
+    monkeypatch.setattr(cisco_agent, "ConnectHandler", lambda **info: connection)
+    try:
+        result = AgentCiscoClient().ping_cisco_command(transcript.split("\r\n")[0], "r1", "admin", "secret")
+    finally:
+        cisco_agent._SessionCache.close_all()
+    return result, connection
+
+
+def test_ping_success_returns_summary_and_drains_prompt(monkeypatch):
+    result, connection = ping_with_transcript(monkeypatch, PING_OK)
+
+    assert result == {"success_pct": 100, "raw": PING_OK}
+    assert connection.pending == "" and connection._read_buffer == ""
+
+
+def test_ping_error_output_stops_at_prompt(monkeypatch):
+    result, connection = ping_with_transcript(monkeypatch, PING_BAD_HOST)
+
+    assert result == "Ping failed. No response received."
+    assert connection.pending == "" and connection._read_buffer == ""
+
+
+def ios_config_echo(text):
+    return "".join(f"{line}\r\nR1(config)#" for line in text.splitlines())
+
+
+def test_config_batch_reads_past_repeated_last_line():
+    commands = ["interface e0/0", "no shutdown", "interface e0/1", "no shutdown"]
+    connection = FakeConnection(ios_config_echo)
+
+    output = AgentCiscoClient()._send_config_batch(connection, commands)
+
+    assert output.count("no shutdown") == 2
+    assert "end of batch" in output
+    assert connection.pending == "" and connection._read_buffer == ""
+
+
+class FakeShell:
+    """
+    Stand-in for an asyncssh interactive shell process answering like IOS.
+    """
+
+    def __init__(self, banner, responder):
+        self.stdin = self
+        self.stdout = self
+        self.responder = responder
+        self.pending = banner
+        self.closed = False
+
+    def write(self, text):
+        self.pending += self.responder(text)
+
+    async def read(self, n):
+        chunk, self.pending = self.pending[:7], self.pending[7:]
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+class FakeSSHConnection:
+
+    def __init__(self, shell):
+        self.shell = shell
+
+    async def create_process(self, **kwargs):
+        return self.shell
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+def ios_shell(text):
+    line = text.strip()
+    if line == "enable":
+        return "enable\r\nR1#"
+    if line == "configure terminal":
+        return "configure terminal\r\nR1(config)#"
+    if line == "end":
+        return "end\r\nR1#"
+    return f"{line}\r\nR1(config)#"
+
+
+def test_aconfig_enables_and_ignores_hash_in_commands(monkeypatch):
+    shell = FakeShell("Welcome\r\nR1>", ios_shell)
+    monkeypatch.setattr(cisco_agent.asyncssh, "connect", lambda *args, **kwargs: FakeSSHConnection(shell))
+
+    output = asyncio.run(AgentCiscoClient().aconfig_command(
+        ["interface e0/0", "description uplink #2"], "r1", "admin", "secret"
+    ))
+
+    assert "enable" in output
+    assert output.endswith("end\r\nR1#")
+    assert shell.pending == ""
+    assert shell.closed
+
+
+def sequence_connection(monkeypatch, prompt="R1#"):
+    sent = []
+    connection = FakeConnection(lambda text: "")
+    connection.base_prompt = "R1"
+    connection.enable = lambda: ""
+    connection.find_prompt = lambda: prompt
+    connection.send_multiline = lambda pairs, **kwargs: sent.extend(pairs) or "ok\r\n"
+    monkeypatch.setattr(cisco_agent, "ConnectHandler", lambda **info: connection)
+    return connection, sent
+
+
+def test_config_accepts_command_expect_dicts(monkeypatch):
+    connection, sent = sequence_connection(monkeypatch)
+    try:
+        output = AgentCiscoClient().config_command(
+            [{"command": "crypto key zeroize rsa", "expect": r"\[yes/no\]"}, {"command": "yes", "expect": "#"},
+             "hostname R1"],
+            "r2", "admin", "secret",
+        )
+    finally:
+        cisco_agent._SessionCache.close_all()
+
+    assert sent == [("crypto key zeroize rsa", r"\[yes/no\]"), ("yes", "#"), ("hostname R1", r"#\s*$")]
+    assert output.startswith("configure terminal")
+
+
+def test_config_rejects_nested_command_lists(monkeypatch):
+    connection, sent = sequence_connection(monkeypatch)
+
+    with pytest.raises(ValueError):
+        AgentCiscoClient().config_command([["interface e0/0", "no shutdown"]], "r2", "admin", "secret")
+    assert sent == []
+
+
+def test_sequence_rejects_a_plain_string_and_keeps_the_session(monkeypatch):
+    connection, sent = sequence_connection(monkeypatch)
+    client = AgentCiscoClient()
+    try:
+        client.send_command_sequence(["show clock"], "r3", "admin", "secret")
+        with pytest.raises(ValueError):
+            client.send_command_sequence("show ver", "r3", "admin", "secret")
+        assert len(cisco_agent._SessionCache._sessions) == 1
+    finally:
+        cisco_agent._SessionCache.close_all()
+    assert sent == [("show clock", r"#\s*$")]
+
+
+def test_sequence_drops_session_left_outside_exec_prompt(monkeypatch):
+    connection, sent = sequence_connection(monkeypatch, prompt="R1(config)#")
+    client = AgentCiscoClient()
+    try:
+        client.send_command_sequence(["configure terminal"], "r4", "admin", "secret")
+        assert cisco_agent._SessionCache._sessions == {}
+        connection.find_prompt = lambda: "R1#"
+        client.send_command_sequence([("show clock", "#")], "r4", "admin", "secret")
+        assert len(cisco_agent._SessionCache._sessions) == 1
+    finally:
+        cisco_agent._SessionCache.close_all()
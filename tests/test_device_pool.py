@@ -0,0 +1,82 @@
+import asyncio
+
+import asyncssh
+
+from agent_client import device_pool
+from agent_client.device_pool import DevicePool
+
+
+class FakeConn:
+
+    def __init__(self, host):
+        self.host = host
+        self.closed = False
+        self.stale = False
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+def fake_connect(opened):
+    async def connect(host, **kwargs):
+        conn = FakeConn(host)
+        opened.append(conn)
+        return conn
+    return connect
+
+
+async def use(conn):
+    if conn.stale:
+        raise asyncssh.ChannelOpenError(asyncssh.OPEN_CONNECT_FAILED, "channel open failed")
+    return conn.host
+
+
+def test_idle_connections_are_capped_across_hosts(monkeypatch):
+    opened = []
+    monkeypatch.setattr(device_pool.asyncssh, "connect", fake_connect(opened))
+
+    async def scan():
+        async with DevicePool(max_idle=2) as pool:
+            results = [await pool.run(host, "admin", "secret", use) for host in ["r1", "r2", "r3", "r4", "r5"]]
+            return results, sum(not conn.closed for conn in opened)
+
+    results, still_open = asyncio.run(scan())
+
+    assert results == ["r1", "r2", "r3", "r4", "r5"]
+    assert still_open == 2
+    assert all(conn.closed for conn in opened)
+
+
+def test_stale_idle_connection_is_replaced(monkeypatch):
+    opened = []
+    monkeypatch.setattr(device_pool.asyncssh, "connect", fake_connect(opened))
+
+    async def scan():
+        async with DevicePool() as pool:
+            await pool.run("r1", "admin", "secret", use)
+            opened[0].stale = True
+            return await pool.run("r1", "admin", "secret", use)
+
+    assert asyncio.run(scan()) == "r1"
+    assert len(opened) == 2
+    assert opened[0].closed
+
+
+def test_idle_connection_is_not_reused_with_another_password(monkeypatch):
+    opened = []
+    monkeypatch.setattr(device_pool.asyncssh, "connect", fake_connect(opened))
+
+    async def scan():
+        async with DevicePool() as pool:
+            await pool.run("r1", "admin", "secret", use)
+            await pool.run("r1", "admin", "wrong", use)
+
+    asyncio.run(scan())
+
+    assert len(opened) == 2
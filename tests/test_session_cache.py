@@ -0,0 +1,117 @@
+import time
+
+import pytest
+from netmiko.exceptions import NetmikoAuthenticationException, ReadTimeout
+
+from agent_client import cisco_agent
+from agent_client.cisco_agent import AgentCiscoClient, _SessionCache
+
+
+class FakeSession:
+    """
+    Stand-in for a Netmiko session that answers every show command with its host.
+    """
+
+    def __init__(self, info):
+        self.info = info
+        self.alive = True
+        self.disconnected = False
+        self.fail_with = None
+
+    def is_alive(self):
+        return self.alive
+
+    def disconnect(self):
+        self.disconnected = True
+
+    def send_command(self, command, **kwargs):
+        if self.fail_with is not None:
+            raise self.fail_with
+        return f"{self.info['host']}: {command}"
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """
+    Patch ConnectHandler with a fake that accepts only the password "secret", and give
+    every test an empty cache.
+    """
+    sessions = []
+
+    def connect(**info):
+        if info["password"] != "secret":
+            raise NetmikoAuthenticationException("bad password")
+        session = FakeSession(info)
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(cisco_agent, "ConnectHandler", connect)
+    monkeypatch.setattr(_SessionCache, "_sessions", {})
+    monkeypatch.setattr(_SessionCache, "_session_locks", {})
+    yield sessions
+    _SessionCache.close_all()
+
+
+def test_session_is_reused(opened):
+    client = AgentCiscoClient()
+
+    assert client.show_command("show clock", "r1", "admin", "secret") == "r1: show clock"
+    assert client.show_command("show version", "r1", "admin", "secret") == "r1: show version"
+    assert len(opened) == 1
+
+
+def test_cached_session_is_not_reused_with_another_password(opened):
+    client = AgentCiscoClient()
+    client.show_command("show clock", "r1", "admin", "secret")
+
+    assert client.show_command("show clock", "r1", "admin", "wrong") == "Authentication error"
+    assert len(opened) == 1
+
+
+def test_fast_cli_opt_out_gets_its_own_session(opened):
+    AgentCiscoClient().show_command("show clock", "r1", "admin", "secret")
+    AgentCiscoClient(fast_cli=False).show_command("show clock", "r1", "admin", "secret")
+
+    assert [session.info["fast_cli"] for session in opened] == [True, False]
+
+
+def test_dead_session_is_replaced(opened):
+    client = AgentCiscoClient()
+    client.show_command("show clock", "r1", "admin", "secret")
+    opened[0].alive = False
+
+    assert client.show_command("show clock", "r1", "admin", "secret") == "r1: show clock"
+    assert len(opened) == 2
+    assert opened[0].disconnected
+
+
+def test_session_is_dropped_when_a_command_fails(opened):
+    client = AgentCiscoClient()
+    client.show_command("show clock", "r1", "admin", "secret")
+    opened[0].fail_with = ReadTimeout("slow output")
+
+    with pytest.raises(ReadTimeout):
+        client.show_command("show tech-support", "r1", "admin", "secret")
+    client.show_command("show clock", "r1", "admin", "secret")
+
+    assert opened[0].disconnected
+    assert len(opened) == 2
+
+
+def test_idle_sessions_expire(opened):
+    AgentCiscoClient().show_command("show clock", "r1", "admin", "secret")
+
+    _SessionCache._prune(now=time.monotonic() + _SessionCache.idle_timeout + 1)
+
+    assert opened[0].disconnected
+    assert _SessionCache._sessions == {}
+    assert _SessionCache._session_locks == {}
+
+
+def test_least_recently_used_session_is_closed_beyond_max_sessions(opened, monkeypatch):
+    monkeypatch.setattr(_SessionCache, "max_sessions", 2)
+    client = AgentCiscoClient()
+    for host in ["r1", "r2", "r3"]:
+        client.show_command("show clock", host, "admin", "secret")
+
+    assert [session.disconnected for session in opened] == [True, False, False]